@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useLocation } from "wouter";
 import { Button } from "@/components/ui/button";
 import { eventStore, type Event, type Task } from "@/lib/eventStore";
@@ -71,6 +71,53 @@ function isSimplePracticeCalendar(calendarId: string | null | undefined): boolea
   return SIMPLEPRACTICE_CALENDAR_PREFIXES.some(prefix => calendarId?.startsWith(prefix));
 }
 
+// Get access token from gapi if available
+function getAccessToken(): string | undefined {
+  if (typeof window === 'undefined') return undefined;
+  try {
+    const gapi = (window as any).gapi;
+    if (gapi?.client && typeof gapi.client.getToken === 'function') {
+      const token = gapi.client.getToken();
+      return token?.access_token;
+    }
+  } catch (error) {
+    console.warn('Could not get access token:', error);
+  }
+  return undefined;
+}
+
+interface AppointmentTimes {
+  startTime: string;
+  endTime: string;
+}
+
+type UpdateAppointment = (input: AppointmentTimes & {
+  googleEventId: string;
+  date: string;
+  accessToken?: string;
+}) => Promise<unknown>;
+
+// Build an undo/redo step that moves an appointment to the given times.
+// Lives outside the component so history entries only retain these
+// arguments, not the render scope (events, tasks, ...) they came from.
+function moveAppointmentStep(
+  updateAppointment: UpdateAppointment,
+  utils: ReturnType<typeof trpc.useUtils>,
+  googleEventId: string,
+  date: string,
+  times: AppointmentTimes
+): () => Promise<void> {
+  return async () => {
+    await updateAppointment({
+      googleEventId,
+      ...times,
+      date,
+      accessToken: getAccessToken(),
+    });
+    await utils.appointments.getByDateRange.invalidate();
+  };
+}
+
 interface DailyConfig {
   header: {
     weeklyOverview: { x: number; y: number; width: number; height: number; textKey: string };
@@ -113,6 +160,8 @@ export default function DailyView() {
   const [newEventTitle, setNewEventTitle] = useState("");
   const [draggingEvent, setDraggingEvent] = useState<string | null>(null);
   const [dragOffset, setDragOffset] = useState({ x: 0, y: 0 });
+  // Times of the dragged event before handleDragMove rewrites them, for undo
+  const dragOriginRef = useRef<AppointmentTimes | null>(null);
   const [dragPreview, setDragPreview] = useState<{ show: boolean; y: number; event: Event | null }>({ show: false, y: 0, event: null });
   const [hasConflict, setHasConflict] = useState(false);
   const [selectedAppointment, setSelectedAppointment] = useState<Event | null>(null);
@@ -124,21 +173,6 @@ export default function DailyView() {
   const utils = trpc.useUtils();
   const { addAction } = useUndoRedo();
 
-  // Get access token from gapi if available
-  function getAccessToken(): string | undefined {
-    if (typeof window === 'undefined') return undefined;
-    try {
-      const gapi = (window as any).gapi;
-      if (gapi?.client && typeof gapi.client.getToken === 'function') {
-        const token = gapi.client.getToken();
-        return token?.access_token;
-      }
-    } catch (error) {
-      console.warn('Could not get access token:', error);
-    }
-    return undefined;
-  }
-
   // Get date from URL parameter or use today (with validation)
   const urlParams = new URLSearchParams(window.location.search);
   const dateParam = urlParams.get('date');
@@ -165,7 +199,7 @@ export default function DailyView() {
       .catch((error) => console.error("Failed to load day template:", error));
 
     // Subscribe to tasks only, events are managed by database query
-    const unsubscribe = eventStore.subscribe(() => {
+    const unsubscribe = eventStore.subscribeToTasks(() => {
       setTasks(eventStore.getTasks());
     });
 
@@ -332,6 +366,7 @@ export default function DailyView() {
     e.preventDefault();
     
     const eventY = timeToY(event.startTime);
+    dragOriginRef.current = { startTime: event.startTime, endTime: event.endTime };
     setDraggingEvent(eventId);
     setDragOffset({
       x: e.clientX,
@@ -405,51 +440,37 @@ export default function DailyView() {
     setHasConflict(false);
     
     const event = events.find(ev => ev.id === draggingEvent);
+    const origin = dragOriginRef.current;
+    dragOriginRef.current = null;
     if (event && event.source === 'google' && event.id) {
-      // Store original times for undo
-      const originalEvent = events.find(ev => ev.id === draggingEvent);
-      const originalStartTime = originalEvent?.startTime || event.startTime;
-      const originalEndTime = originalEvent?.endTime || event.endTime;
-      
+      // Copy out primitives so history entries don't retain the event
+      const eventId = event.id;
+      const date = event.date || currentDateStr;
+      const after: AppointmentTimes = { startTime: event.startTime, endTime: event.endTime };
+      const before = origin ?? after;
+
       try {
         const accessToken = getAccessToken();
         await updateMutation.mutateAsync({
-          googleEventId: event.id,
-          startTime: event.startTime,
-          endTime: event.endTime,
-          date: event.date || currentDateStr,
+          googleEventId: eventId,
+          ...after,
+          date,
           accessToken,
         });
-        
-        // Add undo action
-        addAction({
-          type: 'update',
-          timestamp: new Date(),
-          data: { event, originalStartTime, originalEndTime },
-          description: `Moved ${event.title} from ${originalStartTime} to ${event.startTime}`,
-          undo: async () => {
-            const accessToken = getAccessToken();
-            await updateMutation.mutateAsync({
-              googleEventId: event.id,
-              startTime: originalStartTime,
-              endTime: originalEndTime,
-              date: event.date || currentDateStr,
-              accessToken,
-            });
-            await utils.appointments.getByDateRange.invalidate();
-          },
-          redo: async () => {
-            const accessToken = getAccessToken();
-            await updateMutation.mutateAsync({
-              googleEventId: event.id,
-              startTime: event.startTime,
-              endTime: event.endTime,
-              date: event.date || currentDateStr,
-              accessToken,
-            });
-            await utils.appointments.getByDateRange.invalidate();
-          },
-        });
+
+        // Add undo action (a click without movement has nothing to undo)
+        if (before.startTime !== after.startTime || before.endTime !== after.endTime) {
+          addAction({
+            type: 'update',
+            timestamp: new Date(),
+            data: { eventId, date, before, after },
+            description: `Moved ${event.title} to ${after.startTime}`,
+            // Rapid successive drags of the same event become one undo step
+            coalesceKey: `move:${eventId}`,
+            undo: moveAppointmentStep(updateMutation.mutateAsync, utils, eventId, date, before),
+            redo: moveAppointmentStep(updateMutation.mutateAsync, utils, eventId, date, after),
+          });
+        }
         
         utils.appointments.getByDateRange.invalidate();
       } catch (error) {
@@ -1,77 +1,71 @@
-import { useState, useCallback, useEffect } from 'react';
+import { useState, useCallback, useEffect, useRef } from 'react';
 import { toast } from 'sonner';
+import {
+  UndoHistory,
+  type Action,
+  type UndoHistoryOptions,
+} from '@/lib/undoHistory';
 
-export interface Action {
-  type: 'update' | 'delete' | 'create' | 'status_change';
-  timestamp: Date;
-  data: any;
-  undo: () => Promise<void>;
-  redo: () => Promise<void>;
-  description: string;
-}
+export type { Action, UndoHistoryOptions };
 
-export function useUndoRedo() {
-  const [history, setHistory] = useState<Action[]>([]);
-  const [currentIndex, setCurrentIndex] = useState(-1);
+export function useUndoRedo(options?: UndoHistoryOptions) {
+  const historyRef = useRef<UndoHistory | null>(null);
+  if (!historyRef.current) {
+    historyRef.current = new UndoHistory(options);
+  }
+  const undoHistory = historyRef.current;
+  // The history is mutable; bump a version to re-render on changes
+  const [, setVersion] = useState(0);
+  const refresh = useCallback(() => setVersion(v => v + 1), []);
 
   const addAction = useCallback((action: Action) => {
-    setHistory(prev => {
-      // Remove any actions after current index (they were undone)
-      const newHistory = prev.slice(0, currentIndex + 1);
-      // Add new action
-      newHistory.push(action);
-      // Keep only last 50 actions
-      if (newHistory.length > 50) {
-        newHistory.shift();
-        setCurrentIndex(prev => prev);
-        return newHistory;
-      }
-      setCurrentIndex(newHistory.length - 1);
-      return newHistory;
-    });
-  }, [currentIndex]);
+    undoHistory.push(action);
+    refresh();
+  }, [undoHistory, refresh]);
 
   const undo = useCallback(async () => {
-    if (currentIndex < 0) {
+    if (!undoHistory.canUndo) {
       toast.info('Nothing to undo');
       return;
     }
 
-    const action = history[currentIndex];
+    const action = undoHistory.peekUndo();
     if (!action) {
       toast.error('Action not found');
       return;
     }
     try {
       await action.undo();
-      setCurrentIndex(prev => prev - 1);
+      undoHistory.markUndone();
+      refresh();
       toast.success(`Undone: ${action.description}`);
     } catch (error) {
       toast.error('Failed to undo action');
       console.error('Undo error:', error);
     }
-  }, [currentIndex, history]);
+  }, [undoHistory, refresh]);
 
   const redo = useCallback(async () => {
-    if (currentIndex >= history.length - 1) {
+    if (!undoHistory.canRedo) {
       toast.info('Nothing to redo');
       return;
     }
 
-    const action = history[currentIndex + 1];
+    const action = undoHistory.peekRedo();
     if (!action) {
       toast.error('Action not found');
       return;
     }
     try {
       await action.redo();
-      setCurrentIndex(prev => prev + 1);
+      undoHistory.markRedone();
+      refresh();
       toast.success(`Redone: ${action.description}`);
     } catch (error) {
       toast.error('Failed to redo action');
       console.error('Redo error:', error);
     }
-  }, [currentIndex, history]);
+  }, [undoHistory, refresh]);
 
   // Keyboard shortcuts
   useEffect(() => {
@@ -89,16 +83,13 @@ export function useUndoRedo() {
     return () => window.removeEventListener('keydown', handleKeyDown);
   }, [undo, redo]);
 
-  const canUndo = currentIndex >= 0;
-  const canRedo = currentIndex < history.length - 1;
-
   return {
     addAction,
     undo,
     redo,
-    canUndo,
-    canRedo,
-    history,
-    currentIndex,
+    canUndo: undoHistory.canUndo,
+    canRedo: undoHistory.canRedo,
+    history: undoHistory.getActions(),
+    currentIndex: undoHistory.currentIndex,
   };
 }
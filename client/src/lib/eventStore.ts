@@ -33,61 +33,279 @@ interface Task {
   completed: boolean;
 }
 
+type Listener = () => void;
+
+interface RangeListener {
+  startDate: string;
+  endDate: string;
+  listener: Listener;
+}
+
+// Bucket key for events that have no `date` (e.g. daily-view local events)
+const UNDATED = "";
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+/**
+ * Enumerate ISO dates (YYYY-MM-DD) from startDate to endDate inclusive.
+ */
+function eachDate(startDate: string, endDate: string): string[] {
+  const dates: string[] = [];
+  const end = Date.parse(`${endDate}T00:00:00Z`);
+  for (
+    let t = Date.parse(`${startDate}T00:00:00Z`);
+    t <= end;
+    t += DAY_MS
+  ) {
+    dates.push(new Date(t).toISOString().slice(0, 10));
+  }
+  return dates;
+}
+
 class EventStore {
-  private events: Event[] = [];
-  private tasks: Task[] = [];
-  private listeners: Set<() => void> = new Set();
+  // Maps preserve insertion order, so getEvents()/getTasks() keep the
+  // same ordering the old array-backed store exposed.
+  private events: Map<string, Event> = new Map();
+  private eventsByDate: Map<string, Set<string>> = new Map();
+  private tasks: Map<string, Task> = new Map();
+  private listeners: Set<Listener> = new Set();
+  private taskListeners: Set<Listener> = new Set();
+  private rangeListeners: Set<RangeListener> = new Set();
+
+  // Pending change state, flushed by notify() once the outermost batch ends
+  private batchDepth = 0;
+  private pending = false;
+  private pendingTasks = false;
+  private pendingAllDates = false;
+  private pendingDates: Set<string> = new Set();
 
   /**
    * Subscribe to store changes
    * @param listener Callback function to be called on store updates
    * @returns Unsubscribe function
    */
-  subscribe(listener: () => void): () => void {
+  subscribe(listener: Listener): () => void {
     this.listeners.add(listener);
     return () => {
       this.listeners.delete(listener);
     };
   }
 
+  /**
+   * Subscribe to task changes only
+   * @param listener Callback function to be called when tasks change
+   * @returns Unsubscribe function
+   */
+  subscribeToTasks(listener: Listener): () => void {
+    this.taskListeners.add(listener);
+    return () => {
+      this.taskListeners.delete(listener);
+    };
+  }
+
+  /**
+   * Subscribe to changes of events dated within a range
+   * @param startDate First ISO date (YYYY-MM-DD) of the range, inclusive
+   * @param endDate Last ISO date (YYYY-MM-DD) of the range, inclusive
+   * @param listener Callback function to be called when an event inside the
+   *   range is added, updated, removed, or moved into/out of the range
+   * @returns Unsubscribe function
+   */
+  subscribeToRange(
+    startDate: string,
+    endDate: string,
+    listener: Listener
+  ): () => void {
+    const entry: RangeListener = { startDate, endDate, listener };
+    this.rangeListeners.add(entry);
+    return () => {
+      this.rangeListeners.delete(entry);
+    };
+  }
+
+  /**
+   * Run several mutations and notify subscribers once at the end
+   * @param fn Function performing the mutations; batches may be nested
+   * @returns The return value of fn
+   */
+  batch<T>(fn: () => T): T {
+    this.batchDepth++;
+    try {
+      return fn();
+    } finally {
+      this.batchDepth--;
+      if (this.batchDepth === 0) {
+        this.flush();
+      }
+    }
+  }
+
+  /**
+   * Record an event change for the given dates and notify subscribers
+   * (deferred while a batch is open)
+   */
+  private markEvents(...dates: (string | undefined)[]): void {
+    this.pending = true;
+    for (const date of dates) {
+      if (date) this.pendingDates.add(date);
+    }
+    this.notify();
+  }
+
+  /**
+   * Record a task change and notify subscribers
+   */
+  private markTasks(): void {
+    this.pending = true;
+    this.pendingTasks = true;
+    this.notify();
+  }
+
   /**
    * Notify all subscribers of store changes
    */
   private notify(): void {
+    if (this.batchDepth === 0) {
+      this.flush();
+    }
+  }
+
+  /**
+   * Deliver pending changes: each affected listener is called exactly once
+   */
+  private flush(): void {
+    if (!this.pending) return;
+
+    const tasksChanged = this.pendingTasks;
+    const allDates = this.pendingAllDates;
+    const dates = Array.from(this.pendingDates);
+    this.pending = false;
+    this.pendingTasks = false;
+    this.pendingAllDates = false;
+    this.pendingDates = new Set();
+
     this.listeners.forEach(listener => listener());
+    if (tasksChanged) {
+      this.taskListeners.forEach(listener => listener());
+    }
+    if (allDates || dates.length > 0) {
+      this.rangeListeners.forEach(({ startDate, endDate, listener }) => {
+        if (
+          allDates ||
+          dates.some(date => date >= startDate && date <= endDate)
+        ) {
+          listener();
+        }
+      });
+    }
+  }
+
+  private indexEvent(event: Event): void {
+    const key = event.date ?? UNDATED;
+    let bucket = this.eventsByDate.get(key);
+    if (!bucket) {
+      bucket = new Set();
+      this.eventsByDate.set(key, bucket);
+    }
+    bucket.add(event.id);
+  }
+
+  private unindexEvent(event: Event): void {
+    const key = event.date ?? UNDATED;
+    const bucket = this.eventsByDate.get(key);
+    if (!bucket) return;
+    bucket.delete(event.id);
+    if (bucket.size === 0) {
+      this.eventsByDate.delete(key);
+    }
   }
 
   /**
    * Get all events (returns a copy to prevent external mutations)
    */
   getEvents(): Event[] {
-    return [...this.events];
+    return Array.from(this.events.values());
+  }
+
+  /**
+   * Get a single event by ID
+   */
+  getEvent(id: string): Event | undefined {
+    return this.events.get(id);
+  }
+
+  /**
+   * Get events dated within a range, using the per-date index
+   * @param startDate First ISO date (YYYY-MM-DD) of the range, inclusive
+   * @param endDate Last ISO date (YYYY-MM-DD) of the range, inclusive
+   */
+  getEventsInRange(startDate: string, endDate: string): Event[] {
+    const result: Event[] = [];
+    if (startDate > endDate) return result;
+
+    const dayCount =
+      (Date.parse(`${endDate}T00:00:00Z`) -
+        Date.parse(`${startDate}T00:00:00Z`)) /
+        DAY_MS +
+      1;
+    // For wide ranges it is cheaper to scan the populated buckets instead
+    const keys =
+      dayCount <= this.eventsByDate.size
+        ? eachDate(startDate, endDate)
+        : Array.from(this.eventsByDate.keys())
+            .filter(
+              date => date !== UNDATED && date >= startDate && date <= endDate
+            )
+            .sort();
+
+    for (const date of keys) {
+      const bucket = this.eventsByDate.get(date);
+      if (!bucket) continue;
+      bucket.forEach(id => {
+        const event = this.events.get(id);
+        if (event) result.push(event);
+      });
+    }
+    return result;
   }
 
   /**
    * Replace all events with a new array
    */
   setEvents(events: Event[]): void {
-    this.events = events;
-    this.notify();
+    this.events = new Map();
+    this.eventsByDate = new Map();
+    for (const event of events) {
+      this.events.set(event.id, event);
+    }
+    this.events.forEach(event => this.indexEvent(event));
+    this.pendingAllDates = true;
+    this.markEvents();
   }
 
   /**
    * Add a new event to the store
    */
   addEvent(event: Event): void {
-    this.events.push(event);
-    this.notify();
+    const existing = this.events.get(event.id);
+    if (existing) this.unindexEvent(existing);
+    this.events.set(event.id, event);
+    this.indexEvent(event);
+    this.markEvents(existing?.date, event.date);
   }
 
   /**
    * Update an existing event by ID
    */
   updateEvent(id: string, updates: Partial<Event>): void {
-    const index = this.events.findIndex(e => e.id === id);
-    if (index !== -1) {
-      this.events[index] = { ...this.events[index], ...updates };
-      this.notify();
+    const existing = this.events.get(id);
+    if (existing) {
+      // The id is the map key; changing it here would orphan the entry
+      const updated = { ...existing, ...updates, id };
+      this.unindexEvent(existing);
+      this.events.set(id, updated);
+      this.indexEvent(updated);
+      this.markEvents(existing.date, updated.date);
     }
   }
 
@@ -95,41 +313,45 @@ class EventStore {
    * Delete an event by ID
    */
   deleteEvent(id: string): void {
-    this.events = this.events.filter(e => e.id !== id);
-    this.notify();
+    const existing = this.events.get(id);
+    if (existing) {
+      this.unindexEvent(existing);
+      this.events.delete(id);
+      this.markEvents(existing.date);
+    }
   }
 
   /**
    * Get all tasks (returns a copy to prevent external mutations)
    */
   getTasks(): Task[] {
-    return [...this.tasks];
+    return Array.from(this.tasks.values());
   }
 
   /**
    * Replace all tasks with a new array
    */
   setTasks(tasks: Task[]): void {
-    this.tasks = tasks;
-    this.notify();
+    this.tasks = new Map(tasks.map(task => [task.id, task]));
+    this.markTasks();
   }
 
   /**
    * Add a new task to the store
    */
   addTask(task: Task): void {
-    this.tasks.push(task);
-    this.notify();
+    this.tasks.set(task.id, task);
+    this.markTasks();
   }
 
   /**
    * Update an existing task by ID
    */
   updateTask(id: string, updates: Partial<Task>): void {
-    const index = this.tasks.findIndex(t => t.id === id);
-    if (index !== -1) {
-      this.tasks[index] = { ...this.tasks[index], ...updates };
-      this.notify();
+    const existing = this.tasks.get(id);
+    if (existing) {
+      this.tasks.set(id, { ...existing, ...updates, id });
+      this.markTasks();
     }
   }
 
@@ -137,8 +359,9 @@ class EventStore {
    * Delete a task by ID
    */
   deleteTask(id: string): void {
-    this.tasks = this.tasks.filter(t => t.id !== id);
-    this.notify();
+    if (this.tasks.delete(id)) {
+      this.markTasks();
+    }
   }
 
   /**
@@ -149,8 +372,8 @@ class EventStore {
   searchEvents(query: string): Event[] {
     const lowerQuery = query.toLowerCase().trim();
     if (!lowerQuery) return this.getEvents();
-    
-    return this.events.filter(event => 
+
+    return this.getEvents().filter(event =>
       event.title.toLowerCase().includes(lowerQuery) ||
       event.category?.toLowerCase().includes(lowerQuery) ||
       event.description?.toLowerCase().includes(lowerQuery)
@@ -167,4 +390,5 @@ export const CATEGORIES = [
 ] as const;
 
 export const eventStore = new EventStore();
+export { EventStore };
 export type { Task };
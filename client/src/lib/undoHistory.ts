@@ -0,0 +1,181 @@
+export interface Action {
+  type: 'update' | 'delete' | 'create' | 'status_change';
+  timestamp: Date;
+  data: any; // Prefer a compact diff ({ before, after }) over full snapshots
+  undo: () => Promise<void>;
+  redo: () => Promise<void>;
+  description: string;
+  // Consecutive actions sharing a key (e.g. repeated drags of one event)
+  // within the coalesce window are merged into a single history entry
+  coalesceKey?: string;
+}
+
+export interface UndoHistoryOptions {
+  maxDepth?: number; // Maximum number of entries kept
+  // Budget for the estimated size of all entries. Only `data` and
+  // `description` are measured (plus a fixed per-entry overhead); whatever
+  // the undo/redo closures capture is not, so keep those to primitives.
+  maxBytes?: number;
+  coalesceWindowMs?: number; // Max gap between actions that get merged
+}
+
+interface HistoryEntry {
+  action: Action;
+  size: number;
+}
+
+export const DEFAULT_UNDO_OPTIONS: Required<UndoHistoryOptions> = {
+  maxDepth: 50,
+  maxBytes: 512 * 1024,
+  coalesceWindowMs: 1000,
+};
+
+// Rough fixed cost of an entry: the action object, closures and Date
+const ENTRY_OVERHEAD_BYTES = 256;
+
+/**
+ * Estimate the size of an action's diff payload in bytes (UTF-16 strings).
+ * State captured by the undo/redo closures cannot be measured.
+ */
+export function estimateActionSize(action: Action): number {
+  let dataLength = 0;
+  try {
+    dataLength = JSON.stringify(action.data ?? null).length;
+  } catch {
+    // Circular or non-serializable data; count only the overhead
+  }
+  return (
+    ENTRY_OVERHEAD_BYTES + (action.description.length + dataLength) * 2
+  );
+}
+
+/**
+ * Merge the data of two coalesced actions. Diffs keep the earliest
+ * `before` and the latest `after`; anything else keeps the latest data.
+ */
+function mergeData(previous: any, next: any): any {
+  if (
+    previous && next &&
+    typeof previous === 'object' && typeof next === 'object' &&
+    'before' in previous && 'before' in next
+  ) {
+    return { ...next, before: previous.before };
+  }
+  return next;
+}
+
+/**
+ * Framework-independent undo/redo stack bounded by depth and memory
+ */
+export class UndoHistory {
+  private entries: HistoryEntry[] = [];
+  private index = -1;
+  private bytes = 0;
+  private options: Required<UndoHistoryOptions>;
+
+  constructor(options: UndoHistoryOptions = {}) {
+    this.options = { ...DEFAULT_UNDO_OPTIONS, ...options };
+  }
+
+  /**
+   * Record a new action, discarding any undone actions after the current one
+   */
+  push(action: Action): void {
+    // Remove any actions after current index (they were undone)
+    for (const entry of this.entries.splice(this.index + 1)) {
+      this.bytes -= entry.size;
+    }
+
+    const top = this.entries[this.entries.length - 1];
+    if (
+      top &&
+      action.coalesceKey !== undefined &&
+      top.action.coalesceKey === action.coalesceKey &&
+      action.timestamp.getTime() - top.action.timestamp.getTime() <=
+        this.options.coalesceWindowMs
+    ) {
+      const merged: Action = {
+        ...action,
+        data: mergeData(top.action.data, action.data),
+        // Undo must restore the state from before the first merged action
+        undo: top.action.undo,
+      };
+      this.bytes -= top.size;
+      top.action = merged;
+      top.size = estimateActionSize(merged);
+      this.bytes += top.size;
+    } else {
+      const entry = { action, size: estimateActionSize(action) };
+      this.entries.push(entry);
+      this.bytes += entry.size;
+    }
+    this.index = this.entries.length - 1;
+
+    // Evict oldest entries, always keeping the newest one
+    while (
+      this.entries.length > this.options.maxDepth ||
+      (this.bytes > this.options.maxBytes && this.entries.length > 1)
+    ) {
+      const evicted = this.entries.shift()!;
+      this.bytes -= evicted.size;
+      this.index--;
+    }
+  }
+
+  /**
+   * Action that the next undo would revert, if any
+   */
+  peekUndo(): Action | undefined {
+    return this.entries[this.index]?.action;
+  }
+
+  /**
+   * Action that the next redo would re-apply, if any
+   */
+  peekRedo(): Action | undefined {
+    return this.entries[this.index + 1]?.action;
+  }
+
+  /**
+   * Move the cursor back after the undo of peekUndo() succeeded
+   */
+  markUndone(): void {
+    if (this.index >= 0) this.index--;
+  }
+
+  /**
+   * Move the cursor forward after the redo of peekRedo() succeeded
+   */
+  markRedone(): void {
+    if (this.index < this.entries.length - 1) this.index++;
+  }
+
+  /**
+   * Drop all history
+   */
+  clear(): void {
+    this.entries = [];
+    this.index = -1;
+    this.bytes = 0;
+  }
+
+  get canUndo(): boolean {
+    return this.index >= 0;
+  }
+
+  get canRedo(): boolean {
+    return this.index < this.entries.length - 1;
+  }
+
+  get currentIndex(): number {
+    return this.index;
+  }
+
+  get byteSize(): number {
+    return this.bytes;
+  }
+
+  getActions(): Action[] {
+    return this.entries.map(entry => entry.action);
+  }
+}
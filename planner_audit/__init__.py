@@ -0,0 +1,11 @@
+"""
+Static audit toolkit for the planner application.
+
+Run ``planner-audit system|dom|positioning|alignment|all [project_root]``
+(or ``python -m planner_audit``). Subcommand modules are imported only when
+selected, so keep this package's top level free of heavy imports.
+"""
+
+from .cache import SourceCache
+
+__all__ = ["SourceCache"]
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Comprehensive verification of appointment positioning.
 Calculates exact Y positions for appointments and grid lines.
@@ -6,14 +5,15 @@ Calculates exact Y positions for appointments and grid lines.
 
 import re
 
-def verify_alignment():
+from .cache import WEEKLY_VIEW, SourceCache
+
+def verify_alignment(cache: SourceCache):
     print("=" * 80)
     print("APPOINTMENT ALIGNMENT VERIFICATION")
     print("=" * 80)
     print()
     
-    with open('/home/ubuntu/planner-template-preview/client/src/components/WeeklyView.tsx', 'r') as f:
-        content = f.read()
+    content = cache.read(WEEKLY_VIEW)
     
     # Extract current offset calculation
     print("1. CURRENT OFFSET CALCULATION")
@@ -141,6 +141,3 @@ def verify_alignment():
     
     print()
     print("=" * 80)
-
-if __name__ == "__main__":
-    verify_alignment()
@@ -0,0 +1,32 @@
+"""
+Shared source file cache so each project file is read at most once per run.
+"""
+
+from pathlib import Path
+from typing import Dict, Union
+
+COMPONENTS_DIR = "client/src/components"
+DAILY_VIEW = "client/src/components/DailyView.tsx"
+WEEKLY_VIEW = "client/src/components/WeeklyView.tsx"
+ROUTERS = "server/routers.ts"
+SCHEMA = "drizzle/schema.ts"
+
+
+class SourceCache:
+    def __init__(self, project_root: Union[str, Path]):
+        self.project_root = Path(project_root).resolve()
+        self._files: Dict[str, str] = {}
+
+    def path(self, relative_path: str) -> Path:
+        """Absolute path of a project file"""
+        return self.project_root / relative_path
+
+    def exists(self, relative_path: str) -> bool:
+        """Check whether a project file exists (cached reads count as existing)"""
+        return relative_path in self._files or self.path(relative_path).exists()
+
+    def read(self, relative_path: str) -> str:
+        """Read a project file, returning the cached contents on repeat calls"""
+        if relative_path not in self._files:
+            self._files[relative_path] = self.path(relative_path).read_text()
+        return self._files[relative_path]
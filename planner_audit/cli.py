@@ -0,0 +1,74 @@
+"""
+Single command-line entry point for the audit toolkit.
+"""
+
+import argparse
+import importlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import COMPONENTS_DIR, SourceCache
+
+# Subcommand -> (module, function). Modules are imported lazily so a single
+# subcommand never pays for the others' imports.
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "system": ("planner_audit.system", "run"),
+    "dom": ("planner_audit.dom", "analyze_dom_structure"),
+    "positioning": ("planner_audit.positioning", "analyze_weekly_view"),
+    "alignment": ("planner_audit.alignment", "verify_alignment"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="planner-audit",
+        description="Static audits for the planner application source tree.",
+    )
+    parser.add_argument(
+        "command",
+        choices=[*COMMANDS, "all"],
+        help="audit to run ('all' runs every audit sharing one file cache)",
+    )
+    parser.add_argument(
+        "project_root",
+        nargs="?",
+        default=".",
+        help="path to the planner-template-preview checkout (default: .)",
+    )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="don't write AUDIT_REPORT.json (system audit)",
+    )
+    return parser
+
+
+def run_command(name: str, cache: SourceCache, **options):
+    """Import and run a single audit against the shared cache"""
+    module_name, func_name = COMMANDS[name]
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)(cache, **options)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    root = Path(args.project_root)
+    if not root.is_dir():
+        parser.error(f"project root not found: {args.project_root}")
+    if not (root / COMPONENTS_DIR).is_dir():
+        parser.error(
+            f"{args.project_root} does not look like the planner project "
+            f"(missing {COMPONENTS_DIR})"
+        )
+    cache = SourceCache(root)
+
+    # Per-command keyword options
+    options: Dict[str, Dict[str, Any]] = {
+        "system": {"write_report": not args.no_report},
+    }
+    names = list(COMMANDS) if args.command == "all" else [args.command]
+    for name in names:
+        run_command(name, cache, **options.get(name, {}))
+    return 0
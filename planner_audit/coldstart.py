@@ -0,0 +1,62 @@
+"""
+Measure planner-audit cold start and fail if it exceeds the budget.
+
+Usage: python -m planner_audit.coldstart [project_root] [--budget-ms N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Editor save hooks should feel instant; a fresh interpreter running any
+# subcommand, including 'all', must finish within this budget.
+COLD_START_BUDGET_MS = 150
+RUNS = 5
+COMMANDS = ["system", "dom", "positioning", "alignment", "all"]
+
+
+def median_ms(argv: List[str], runs: int = RUNS) -> float:
+    """Median wall-clock milliseconds of fresh interpreter runs"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def measure(project_root: str, runs: int = RUNS) -> Dict[str, float]:
+    """Median cold start per subcommand, without writing AUDIT_REPORT.json"""
+    return {
+        command: median_ms(
+            [sys.executable, "-m", "planner_audit", command, project_root, "--no-report"],
+            runs,
+        )
+        for command in COMMANDS
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure planner-audit cold start against a budget."
+    )
+    parser.add_argument("project_root", nargs="?", default=".")
+    parser.add_argument("--budget-ms", type=float, default=COLD_START_BUDGET_MS)
+    args = parser.parse_args()
+
+    baseline = median_ms([sys.executable, "-c", "pass"])
+    print(f"{'python':<12} {baseline:7.1f}ms (interpreter baseline)")
+
+    over_budget = False
+    for command, elapsed in measure(args.project_root).items():
+        status = "ok" if elapsed <= args.budget_ms else "OVER BUDGET"
+        print(f"{command:<12} {elapsed:7.1f}ms (budget {args.budget_ms:.0f}ms) {status}")
+        over_budget = over_budget or elapsed > args.budget_ms
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
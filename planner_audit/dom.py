@@ -1,11 +1,12 @@
-#!/usr/bin/env python3
 """
 Analyze the actual DOM structure to find where grid lines should be positioned.
 """
 
 import re
 
-def analyze_dom_structure():
+from .cache import WEEKLY_VIEW, SourceCache
+
+def analyze_dom_structure(cache: SourceCache):
     """Analyze the WeeklyView DOM structure."""
     
     print("=" * 80)
@@ -13,8 +14,7 @@ def analyze_dom_structure():
     print("=" * 80)
     print()
     
-    with open('/home/ubuntu/planner-template-preview/client/src/components/WeeklyView.tsx', 'r') as f:
-        content = f.read()
+    content = cache.read(WEEKLY_VIEW)
     
     print("1. CONTAINER STRUCTURE")
     print("-" * 80)
@@ -99,6 +99,3 @@ def analyze_dom_structure():
     print("  5. Compare: appointment.top should equal grid_line.offsetTop")
     print()
     print("=" * 80)
-
-if __name__ == "__main__":
-    analyze_dom_structure()
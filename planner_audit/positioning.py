@@ -1,13 +1,13 @@
-#!/usr/bin/env python3
 """
-Audit script for WeeklyView appointment positioning logic.
+Audit WeeklyView appointment positioning logic.
 Analyzes the offset calculations and verifies alignment math.
 """
 
 import re
-import json
 
-def analyze_weekly_view():
+from .cache import WEEKLY_VIEW, SourceCache
+
+def analyze_weekly_view(cache: SourceCache):
     """Analyze WeeklyView.tsx for positioning logic."""
     
     print("=" * 80)
@@ -16,8 +16,7 @@ def analyze_weekly_view():
     print()
     
     # Read the WeeklyView component
-    with open('/home/ubuntu/planner-template-preview/client/src/components/WeeklyView.tsx', 'r') as f:
-        content = f.read()
+    content = cache.read(WEEKLY_VIEW)
     
     # Extract positioning calculation
     offset_match = re.search(r'const headerOffset = (.+?);', content, re.DOTALL)
@@ -151,6 +150,3 @@ def analyze_weekly_view():
     print("  4. Adjust the offset value if there's a discrepancy")
     print()
     print("=" * 80)
-
-if __name__ == "__main__":
-    analyze_weekly_view()
@@ -1,18 +1,18 @@
-#!/usr/bin/env python3
 """
-Comprehensive System Audit Script for Planner Application
+Comprehensive System Audit for Planner Application
 Identifies issues with drag-and-drop, duplication, notes display, and data accuracy
 """
 
 import json
-import os
 import re
-from pathlib import Path
-from typing import List, Dict, Any
+
+from .cache import DAILY_VIEW, ROUTERS, SCHEMA, SourceCache
 
 class SystemAuditor:
-    def __init__(self, project_root: str):
-        self.project_root = Path(project_root)
+    def __init__(self, cache: SourceCache, write_report: bool = True):
+        self.cache = cache
+        self.project_root = cache.project_root
+        self.write_report = write_report
         self.issues = []
         self.warnings = []
         
@@ -38,12 +38,12 @@ class SystemAuditor:
         """Audit drag-and-drop implementation"""
         print("🔍 Auditing drag-and-drop logic...")
         
-        daily_view = self.project_root / "client/src/components/DailyView.tsx"
-        if not daily_view.exists():
+        daily_view = self.cache.path(DAILY_VIEW)
+        if not self.cache.exists(DAILY_VIEW):
             self.log_issue("DRAG_DROP", "CRITICAL", "DailyView.tsx not found", str(daily_view))
             return
             
-        content = daily_view.read_text()
+        content = self.cache.read(DAILY_VIEW)
         
         # Check for handleDragStart
         if "handleDragStart" not in content:
@@ -77,11 +77,11 @@ class SystemAuditor:
         """Audit for appointment duplication causes"""
         print("🔍 Auditing duplication issues...")
         
-        daily_view = self.project_root / "client/src/components/DailyView.tsx"
-        if not daily_view.exists():
+        daily_view = self.cache.path(DAILY_VIEW)
+        if not self.cache.exists(DAILY_VIEW):
             return
             
-        content = daily_view.read_text()
+        content = self.cache.read(DAILY_VIEW)
         
         # Check for duplicate event merging
         if content.count("[...localEvents, ...dbEvents]") > 0:
@@ -106,11 +106,11 @@ class SystemAuditor:
         """Audit notes and reminders display logic"""
         print("🔍 Auditing notes and reminders display...")
         
-        daily_view = self.project_root / "client/src/components/DailyView.tsx"
-        if not daily_view.exists():
+        daily_view = self.cache.path(DAILY_VIEW)
+        if not self.cache.exists(DAILY_VIEW):
             return
             
-        content = daily_view.read_text()
+        content = self.cache.read(DAILY_VIEW)
         
         # Check if notes field is loaded from database
         if "notes:" not in content or "notes: apt.notes" not in content:
@@ -144,11 +144,11 @@ class SystemAuditor:
         """Audit data loading and accuracy"""
         print("🔍 Auditing data accuracy...")
         
-        daily_view = self.project_root / "client/src/components/DailyView.tsx"
-        if not daily_view.exists():
+        daily_view = self.cache.path(DAILY_VIEW)
+        if not self.cache.exists(DAILY_VIEW):
             return
             
-        content = daily_view.read_text()
+        content = self.cache.read(DAILY_VIEW)
         
         # Check for proper database query
         if "trpc.appointments.getByDateRange.useQuery" not in content:
@@ -163,9 +163,9 @@ class SystemAuditor:
             self.log_warning("DATA_ACCURACY", "Date string variable not found", str(daily_view))
             
         # Check backend router
-        routers = self.project_root / "server/routers.ts"
-        if routers.exists():
-            router_content = routers.read_text()
+        routers = self.cache.path(ROUTERS)
+        if self.cache.exists(ROUTERS):
+            router_content = self.cache.read(ROUTERS)
             
             # Check if getByDateRange returns all necessary fields
             if "getByDateRange" in router_content:
@@ -180,12 +180,12 @@ class SystemAuditor:
         """Audit database schema"""
         print("🔍 Auditing database schema...")
         
-        schema = self.project_root / "drizzle/schema.ts"
-        if not schema.exists():
+        schema = self.cache.path(SCHEMA)
+        if not self.cache.exists(SCHEMA):
             self.log_issue("DATABASE", "CRITICAL", "Database schema file not found", str(schema))
             return
             
-        content = schema.read_text()
+        content = self.cache.read(SCHEMA)
         
         # Check for required fields in appointments table
         required_fields = ["title", "notes", "reminders", "status", "startTime", "endTime"]
@@ -199,11 +199,11 @@ class SystemAuditor:
         """Audit React state management"""
         print("🔍 Auditing state management...")
         
-        daily_view = self.project_root / "client/src/components/DailyView.tsx"
-        if not daily_view.exists():
+        daily_view = self.cache.path(DAILY_VIEW)
+        if not self.cache.exists(DAILY_VIEW):
             return
             
-        content = daily_view.read_text()
+        content = self.cache.read(DAILY_VIEW)
         
         # Count useState hooks
         usestate_count = content.count("useState")
@@ -268,6 +268,9 @@ class SystemAuditor:
                     
         print("\n" + "="*80)
         
+        if not self.write_report:
+            return
+            
         # Save report to file
         report_file = self.project_root / "AUDIT_REPORT.json"
         with open(report_file, 'w') as f:
@@ -299,7 +302,7 @@ class SystemAuditor:
         
         self.generate_report()
 
-if __name__ == "__main__":
-    project_root = "/home/ubuntu/planner-template-preview"
-    auditor = SystemAuditor(project_root)
-    auditor.run_audit()
+
+def run(cache: SourceCache, write_report: bool = True):
+    """Run the complete system audit"""
+    SystemAuditor(cache, write_report).run_audit()
@@ -0,0 +1,81 @@
+import { bench, describe } from 'vitest';
+import { EventStore, type Event } from '../client/src/lib/eventStore';
+
+// Headless EventStore benchmarks. Run with `pnpm bench`; pass
+// `--outputJson bench_output.json` to record numbers for comparison.
+
+const SIZES = [10_000, 100_000];
+const DRAG_STEPS = 200;
+
+function isoDate(dayOffset: number): string {
+  return new Date(Date.UTC(2025, 0, 1) + dayOffset * 86_400_000)
+    .toISOString()
+    .slice(0, 10);
+}
+
+function makeEvents(count: number): Event[] {
+  const events: Event[] = [];
+  for (let i = 0; i < count; i++) {
+    events.push({
+      id: `evt-${i}`,
+      title: `Appointment ${i}`,
+      startTime: `${String(6 + (i % 14)).padStart(2, '0')}:00`,
+      endTime: `${String(7 + (i % 14)).padStart(2, '0')}:00`,
+      color: '#4F5D67',
+      source: 'google',
+      date: isoDate(i % 365),
+    });
+  }
+  return events;
+}
+
+function makeStore(events: Event[]): EventStore {
+  const store = new EventStore();
+  store.setEvents(events);
+  // Simulate a mounted view re-reading the store on every notification
+  store.subscribe(() => store.getEventsInRange('2025-03-03', '2025-03-09'));
+  return store;
+}
+
+for (const size of SIZES) {
+  const events = makeEvents(size);
+
+  describe(`EventStore with ${size} events`, () => {
+    bench('bulk import (setEvents)', () => {
+      new EventStore().setEvents(events);
+    });
+
+    bench('bulk import (batched addEvent)', () => {
+      const store = makeStore([]);
+      store.batch(() => events.forEach(event => store.addEvent(event)));
+    });
+
+    const dragStore = makeStore(events);
+    bench(`drag burst (${DRAG_STEPS} updates, unbatched)`, () => {
+      for (let step = 0; step < DRAG_STEPS; step++) {
+        dragStore.updateEvent('evt-42', { date: isoDate(step % 7 + 61) });
+      }
+    });
+
+    bench(`drag burst (${DRAG_STEPS} updates, batched)`, () => {
+      dragStore.batch(() => {
+        for (let step = 0; step < DRAG_STEPS; step++) {
+          dragStore.updateEvent('evt-42', { date: isoDate(step % 7 + 61) });
+        }
+      });
+    });
+
+    const churnStore = makeStore(events);
+    bench('delete + re-add single event', () => {
+      const event = churnStore.getEvent('evt-7')!;
+      churnStore.batch(() => {
+        churnStore.deleteEvent(event.id);
+        churnStore.addEvent(event);
+      });
+    });
+
+    bench('week range query', () => {
+      dragStore.getEventsInRange('2025-03-03', '2025-03-09');
+    });
+  });
+}
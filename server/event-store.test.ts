@@ -0,0 +1,217 @@
+import { describe, it, expect, beforeEach } from 'vitest';
+import { EventStore, type Event } from '../client/src/lib/eventStore';
+
+function makeEvent(id: string, date?: string, overrides: Partial<Event> = {}): Event {
+  return {
+    id,
+    title: `Appointment ${id}`,
+    startTime: '10:00',
+    endTime: '11:00',
+    color: '#4F5D67',
+    date,
+    ...overrides,
+  };
+}
+
+describe('EventStore', () => {
+  let store: EventStore;
+
+  beforeEach(() => {
+    store = new EventStore();
+  });
+
+  describe('Indexed mutations', () => {
+    it('should look up, update and delete events by id', () => {
+      store.setEvents([makeEvent('1', '2025-11-20'), makeEvent('2', '2025-11-21')]);
+
+      store.updateEvent('1', { startTime: '14:00' });
+      expect(store.getEvent('1')?.startTime).toBe('14:00');
+
+      store.deleteEvent('2');
+      expect(store.getEvent('2')).toBeUndefined();
+      expect(store.getEvents().map(e => e.id)).toEqual(['1']);
+    });
+
+    it('should keep events under their original id when updates include an id', () => {
+      store.addEvent(makeEvent('1', '2025-11-20'));
+      store.updateEvent('1', { id: '2', title: 'Renamed' });
+
+      expect(store.getEvent('1')?.title).toBe('Renamed');
+      expect(store.getEvent('2')).toBeUndefined();
+      expect(store.getEventsInRange('2025-11-20', '2025-11-20').map(e => e.id)).toEqual(['1']);
+    });
+
+    it('should preserve insertion order after updates', () => {
+      store.addEvent(makeEvent('a', '2025-11-20'));
+      store.addEvent(makeEvent('b', '2025-11-20'));
+      store.addEvent(makeEvent('c', '2025-11-20'));
+      store.updateEvent('a', { title: 'Updated' });
+
+      expect(store.getEvents().map(e => e.id)).toEqual(['a', 'b', 'c']);
+    });
+
+    it('should return a copy from getEvents', () => {
+      store.addEvent(makeEvent('1', '2025-11-20'));
+      store.getEvents().pop();
+
+      expect(store.getEvents()).toHaveLength(1);
+    });
+
+    it('should index tasks by id', () => {
+      store.setTasks([{ id: 't1', text: 'Call back', completed: false }]);
+      store.updateTask('t1', { completed: true });
+      store.addTask({ id: 't2', text: 'Send notes', completed: false });
+      store.deleteTask('t2');
+
+      expect(store.getTasks()).toEqual([{ id: 't1', text: 'Call back', completed: true }]);
+    });
+  });
+
+  describe('Date range queries', () => {
+    beforeEach(() => {
+      store.setEvents([
+        makeEvent('1', '2025-11-16'),
+        makeEvent('2', '2025-11-17'),
+        makeEvent('3', '2025-11-20'),
+        makeEvent('4', '2025-11-23'),
+        makeEvent('5', '2025-11-24'),
+        makeEvent('6'),
+      ]);
+    });
+
+    it('should return nothing for an inverted range', () => {
+      expect(store.getEventsInRange('2025-11-23', '2025-11-17')).toEqual([]);
+    });
+
+    it('should return events within an inclusive range', () => {
+      const ids = store.getEventsInRange('2025-11-17', '2025-11-23').map(e => e.id);
+      expect(ids).toEqual(['2', '3', '4']);
+    });
+
+    it('should use the same results for ranges wider than the index', () => {
+      const ids = store.getEventsInRange('2025-01-01', '2025-12-31').map(e => e.id);
+      expect(ids).toEqual(['1', '2', '3', '4', '5']);
+    });
+
+    it('should return the same results when enumerating days of a narrow range', () => {
+      // More populated dates than days in the range selects the per-day path
+      for (let day = 1; day <= 30; day++) {
+        store.addEvent(makeEvent(`dec-${day}`, `2025-12-${String(day).padStart(2, '0')}`));
+      }
+
+      const ids = store.getEventsInRange('2025-11-20', '2025-12-02').map(e => e.id);
+      expect(ids).toEqual(['3', '4', '5', 'dec-1', 'dec-2']);
+    });
+
+    it('should move events between date buckets on update', () => {
+      store.updateEvent('5', { date: '2025-11-18' });
+      store.updateEvent('2', { date: '2025-12-01' });
+
+      const ids = store.getEventsInRange('2025-11-17', '2025-11-23').map(e => e.id);
+      expect(ids).toEqual(['5', '3', '4']);
+    });
+  });
+
+  describe('Batched notifications', () => {
+    it('should notify once per mutation outside a batch', () => {
+      let calls = 0;
+      store.subscribe(() => calls++);
+
+      store.addEvent(makeEvent('1', '2025-11-20'));
+      store.updateEvent('1', { title: 'Moved' });
+
+      expect(calls).toBe(2);
+    });
+
+    it('should coalesce mutations inside a batch into one notification', () => {
+      let calls = 0;
+      store.subscribe(() => calls++);
+
+      store.batch(() => {
+        for (let i = 0; i < 100; i++) {
+          store.addEvent(makeEvent(String(i), '2025-11-20'));
+        }
+        store.batch(() => store.deleteEvent('0'));
+        expect(calls).toBe(0);
+      });
+
+      expect(calls).toBe(1);
+      expect(store.getEvents()).toHaveLength(99);
+    });
+
+    it('should still notify when a batch throws', () => {
+      let calls = 0;
+      store.subscribe(() => calls++);
+
+      expect(() =>
+        store.batch(() => {
+          store.addEvent(makeEvent('1', '2025-11-20'));
+          throw new Error('sync failed');
+        })
+      ).toThrow('sync failed');
+      expect(calls).toBe(1);
+    });
+
+    it('should not notify when a batch makes no changes', () => {
+      let calls = 0;
+      store.subscribe(() => calls++);
+
+      store.batch(() => store.updateEvent('missing', { title: 'Nope' }));
+
+      expect(calls).toBe(0);
+    });
+
+    it('should not notify when deleting a missing event or task', () => {
+      let calls = 0;
+      let taskCalls = 0;
+      store.subscribe(() => calls++);
+      store.subscribeToTasks(() => taskCalls++);
+
+      store.deleteEvent('missing');
+      store.deleteTask('missing');
+
+      expect([calls, taskCalls]).toEqual([0, 0]);
+    });
+  });
+
+  describe('Range and task subscriptions', () => {
+    it('should only notify range subscribers for changes inside their range', () => {
+      let thisWeek = 0;
+      let nextWeek = 0;
+      store.subscribeToRange('2025-11-17', '2025-11-23', () => thisWeek++);
+      store.subscribeToRange('2025-11-24', '2025-11-30', () => nextWeek++);
+
+      store.addEvent(makeEvent('1', '2025-11-20'));
+      expect([thisWeek, nextWeek]).toEqual([1, 0]);
+
+      // Moving across weeks affects both ranges
+      store.updateEvent('1', { date: '2025-11-25' });
+      expect([thisWeek, nextWeek]).toEqual([2, 1]);
+
+      store.addEvent(makeEvent('2'));
+      store.addTask({ id: 't1', text: 'Call back', completed: false });
+      expect([thisWeek, nextWeek]).toEqual([2, 1]);
+    });
+
+    it('should notify every range subscriber when all events are replaced', () => {
+      let calls = 0;
+      store.subscribeToRange('2030-01-01', '2030-01-07', () => calls++);
+
+      store.setEvents([]);
+
+      expect(calls).toBe(1);
+    });
+
+    it('should only notify task subscribers for task changes', () => {
+      let calls = 0;
+      const unsubscribe = store.subscribeToTasks(() => calls++);
+
+      store.addEvent(makeEvent('1', '2025-11-20'));
+      store.addTask({ id: 't1', text: 'Call back', completed: false });
+      unsubscribe();
+      store.deleteTask('t1');
+
+      expect(calls).toBe(1);
+    });
+  });
+});
@@ -0,0 +1,193 @@
+import { UndoHistory, type Action } from '../client/src/lib/undoHistory';
+import type { Event } from '../client/src/lib/eventStore';
+
+// Heap growth of DailyView's undo history over a long drag-editing session.
+// Run with `pnpm bench:undo` (needs --expose-gc for stable numbers).
+//
+// Each edit replays what DailyView does: handleDragMove rewrites the events
+// state with `map`, a re-render creates fresh handlers, and handleDragEnd
+// records an undo entry whose closures call the update mutation.
+//
+// "legacy" is the previous useUndoRedo: a plain array capped at 50 entries,
+// `data: { event, originalStartTime, originalEndTime }` and closures created
+// inside the render, so they keep that render's scope (incl. `events`) alive.
+// "diff" is UndoHistory with the current DailyView recording: primitive
+// before/after diffs, closures built outside the component, coalescing and
+// the default depth/memory caps.
+
+const EDITS = 5_000;
+const DAY_EVENTS = 12;
+const DRAG_BURST = 5; // consecutive moves of one event, 200ms apart
+// Histories are small; keep several alive at once so GC noise averages out
+const SESSIONS = 20;
+
+const gc = (globalThis as { gc?: () => void }).gc;
+
+interface AppointmentTimes {
+  startTime: string;
+  endTime: string;
+}
+
+// Stand-ins for the tRPC mutation and utils, shared by every entry
+const updateAppointment = async (
+  _input: AppointmentTimes & { googleEventId: string; date: string; accessToken?: string }
+) => {};
+const utils = { appointments: { getByDateRange: { invalidate: async () => {} } } };
+const getAccessToken = (): string | undefined => undefined;
+
+function heapUsed(): number {
+  gc?.();
+  return process.memoryUsage().heapUsed;
+}
+
+function makeDay(): Event[] {
+  return Array.from({ length: DAY_EVENTS }, (_, i) => ({
+    id: `evt-${i}`,
+    title: `Client session ${i}`,
+    startTime: '10:00',
+    endTime: '11:00',
+    color: '#4F5D67',
+    source: 'google',
+    date: '2025-11-20',
+    description: 'Presenting concerns and session notes '.repeat(4),
+    notes: 'Follow up on homework, review treatment plan '.repeat(4),
+  }));
+}
+
+// Simulated handleDragMove: the dragged event gets new times
+function dragMove(events: Event[], edit: number): { events: Event[]; id: string } {
+  const id = `evt-${Math.floor(edit / DRAG_BURST) % DAY_EVENTS}`;
+  const hour = 10 + (edit % 8);
+  const times = { startTime: `${hour}:00`, endTime: `${hour + 1}:00` };
+  return { events: events.map(ev => (ev.id === id ? { ...ev, ...times } : ev)), id };
+}
+
+function timestamp(edit: number): Date {
+  return new Date(edit * 200 + Math.floor(edit / DRAG_BURST) * 5000);
+}
+
+function renderLegacy(events: Event[], addAction: (action: Action) => void) {
+  const currentDateStr = '2025-11-20';
+  return (draggingEvent: string, edit: number) => {
+    const event = events.find(ev => ev.id === draggingEvent)!;
+    const originalStartTime = event.startTime;
+    const originalEndTime = event.endTime;
+    addAction({
+      type: 'update',
+      timestamp: timestamp(edit),
+      data: { event, originalStartTime, originalEndTime },
+      description: `Moved ${event.title} from ${originalStartTime} to ${event.startTime}`,
+      undo: async () => {
+        await updateAppointment({
+          googleEventId: event.id,
+          startTime: originalStartTime,
+          endTime: originalEndTime,
+          date: event.date || currentDateStr,
+          accessToken: getAccessToken(),
+        });
+        await utils.appointments.getByDateRange.invalidate();
+      },
+      redo: async () => {
+        await updateAppointment({
+          googleEventId: event.id,
+          startTime: event.startTime,
+          endTime: event.endTime,
+          date: event.date || currentDateStr,
+          accessToken: getAccessToken(),
+        });
+        await utils.appointments.getByDateRange.invalidate();
+      },
+    });
+  };
+}
+
+function moveAppointmentStep(
+  googleEventId: string,
+  date: string,
+  times: AppointmentTimes
+): () => Promise<void> {
+  return async () => {
+    await updateAppointment({ googleEventId, ...times, date, accessToken: getAccessToken() });
+    await utils.appointments.getByDateRange.invalidate();
+  };
+}
+
+function renderDiff(events: Event[], history: UndoHistory, origin: AppointmentTimes) {
+  const currentDateStr = '2025-11-20';
+  return (draggingEvent: string, edit: number) => {
+    const event = events.find(ev => ev.id === draggingEvent)!;
+    const eventId = event.id;
+    const date = event.date || currentDateStr;
+    const after: AppointmentTimes = { startTime: event.startTime, endTime: event.endTime };
+    const before = origin;
+    history.push({
+      type: 'update',
+      timestamp: timestamp(edit),
+      data: { eventId, date, before, after },
+      description: `Moved ${event.title} to ${after.startTime}`,
+      coalesceKey: `move:${eventId}`,
+      undo: moveAppointmentStep(eventId, date, before),
+      redo: moveAppointmentStep(eventId, date, after),
+    });
+  };
+}
+
+interface Session {
+  history: unknown;
+  entries: number;
+  undoableEdits: number; // drag steps the retained entries can revert
+}
+
+function legacySession(): Session {
+  let events = makeDay();
+  const history: Action[] = [];
+  const addAction = (action: Action) => {
+    history.push(action);
+    if (history.length > 50) history.shift();
+  };
+  for (let i = 0; i < EDITS; i++) {
+    const moved = dragMove(events, i);
+    events = moved.events;
+    renderLegacy(events, addAction)(moved.id, i);
+  }
+  return { history, entries: history.length, undoableEdits: history.length };
+}
+
+function diffSession(): Session {
+  let events = makeDay();
+  const history = new UndoHistory();
+  for (let i = 0; i < EDITS; i++) {
+    const moved = dragMove(events, i);
+    // handleDragStart records the times before the move rewrites them
+    const original = events.find(ev => ev.id === moved.id)!;
+    const origin = { startTime: original.startTime, endTime: original.endTime };
+    events = moved.events;
+    renderDiff(events, history, origin)(moved.id, i);
+  }
+  const entries = history.getActions().length;
+  return { history, entries, undoableEdits: entries * DRAG_BURST };
+}
+
+function measure(label: string, run: () => Session): void {
+  const before = heapUsed();
+  const sessions = Array.from({ length: SESSIONS }, run);
+  const perSession = (heapUsed() - before) / SESSIONS;
+  const { entries, undoableEdits } = sessions[0];
+  console.log(
+    `${label.padEnd(8)} ${(perSession / 1024).toFixed(1).padStart(8)} KiB/session` +
+      `  ${String(entries).padStart(4)} entries` +
+      `  ${String(undoableEdits).padStart(4)} undoable drag steps`
+  );
+  // Keep the histories reachable until after the measurement
+  if (!sessions.every(session => session.history)) throw new Error('nothing retained');
+}
+
+if (!gc) {
+  console.warn('Run with --expose-gc for accurate heap numbers');
+}
+console.log(`${EDITS} drag edits over ${DAY_EVENTS} appointments`);
+// Warm up both paths so compiled code isn't counted as history growth
+legacySession();
+diffSession();
+measure('legacy', legacySession);
+measure('diff', diffSession);
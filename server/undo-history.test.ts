@@ -0,0 +1,125 @@
+import { describe, it, expect } from 'vitest';
+import { UndoHistory, estimateActionSize, type Action } from '../client/src/lib/undoHistory';
+
+function makeAction(n: number, overrides: Partial<Action> = {}): Action {
+  return {
+    type: 'update',
+    timestamp: new Date(n * 10_000),
+    data: { eventId: `evt-${n}`, before: { startTime: '10:00' }, after: { startTime: '11:00' } },
+    description: `Action ${n}`,
+    undo: async () => {},
+    redo: async () => {},
+    ...overrides,
+  };
+}
+
+describe('UndoHistory', () => {
+  describe('Cursor movement', () => {
+    it('should undo and redo through recorded actions', () => {
+      const history = new UndoHistory();
+      history.push(makeAction(1));
+      history.push(makeAction(2));
+
+      expect(history.peekUndo()?.description).toBe('Action 2');
+      history.markUndone();
+      expect(history.currentIndex).toBe(0);
+      expect(history.peekRedo()?.description).toBe('Action 2');
+      history.markRedone();
+      expect(history.canRedo).toBe(false);
+    });
+
+    it('should discard undone actions when a new action is added', () => {
+      const history = new UndoHistory();
+      history.push(makeAction(1));
+      history.push(makeAction(2));
+      history.push(makeAction(3));
+      history.markUndone();
+      history.markUndone();
+      history.push(makeAction(4));
+
+      expect(history.getActions().map(a => a.description)).toEqual(['Action 1', 'Action 4']);
+      expect(history.currentIndex).toBe(1);
+    });
+  });
+
+  describe('Bounds', () => {
+    it('should limit history to the maximum depth', () => {
+      const history = new UndoHistory({ maxDepth: 50 });
+      for (let i = 0; i < 60; i++) {
+        history.push(makeAction(i));
+      }
+
+      const actions = history.getActions();
+      expect(actions.length).toBe(50);
+      expect(actions[0].description).toBe('Action 10');
+      expect(history.currentIndex).toBe(49);
+    });
+
+    it('should evict oldest actions to stay within the memory budget', () => {
+      const entrySize = estimateActionSize(makeAction(0));
+      const history = new UndoHistory({ maxDepth: 1000, maxBytes: entrySize * 10 });
+      for (let i = 0; i < 100; i++) {
+        history.push(makeAction(i));
+      }
+
+      expect(history.getActions().length).toBeLessThanOrEqual(10);
+      expect(history.byteSize).toBeLessThanOrEqual(entrySize * 10);
+      expect(history.peekUndo()?.description).toBe('Action 99');
+    });
+
+    it('should keep the newest action even if it exceeds the budget', () => {
+      const history = new UndoHistory({ maxBytes: 1 });
+      history.push(makeAction(1));
+
+      expect(history.getActions().length).toBe(1);
+    });
+  });
+
+  describe('Coalescing', () => {
+    it('should merge rapid moves of the same event into one entry', async () => {
+      const calls: string[] = [];
+      const history = new UndoHistory({ coalesceWindowMs: 1000 });
+      const move = (ms: number, from: string, to: string): Action =>
+        makeAction(0, {
+          timestamp: new Date(ms),
+          coalesceKey: 'move:evt-1',
+          data: { eventId: 'evt-1', before: { startTime: from }, after: { startTime: to } },
+          undo: async () => { calls.push(`undo to ${from}`); },
+          redo: async () => { calls.push(`redo to ${to}`); },
+        });
+
+      history.push(move(0, '10:00', '11:00'));
+      history.push(move(400, '11:00', '12:00'));
+      history.push(move(800, '12:00', '13:00'));
+
+      expect(history.getActions().length).toBe(1);
+      const merged = history.peekUndo()!;
+      expect(merged.data.before).toEqual({ startTime: '10:00' });
+      expect(merged.data.after).toEqual({ startTime: '13:00' });
+
+      await merged.undo();
+      await merged.redo();
+      expect(calls).toEqual(['undo to 10:00', 'redo to 13:00']);
+    });
+
+    it('should not merge actions outside the window or with different keys', () => {
+      const history = new UndoHistory({ coalesceWindowMs: 1000 });
+      history.push(makeAction(0, { timestamp: new Date(0), coalesceKey: 'move:evt-1' }));
+      history.push(makeAction(1, { timestamp: new Date(5000), coalesceKey: 'move:evt-1' }));
+      history.push(makeAction(2, { timestamp: new Date(5100), coalesceKey: 'move:evt-2' }));
+      history.push(makeAction(3, { timestamp: new Date(5200) }));
+      history.push(makeAction(4, { timestamp: new Date(5300) }));
+
+      expect(history.getActions().length).toBe(5);
+    });
+
+    it('should not merge into an action that was undone', () => {
+      const history = new UndoHistory();
+      history.push(makeAction(0, { timestamp: new Date(0), coalesceKey: 'move:evt-1' }));
+      history.markUndone();
+      history.push(makeAction(1, { timestamp: new Date(100), coalesceKey: 'move:evt-1' }));
+
+      expect(history.getActions().map(a => a.description)).toEqual(['Action 1']);
+    });
+  });
+});
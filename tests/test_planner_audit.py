@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from planner_audit import cli, coldstart
+from planner_audit.cache import WEEKLY_VIEW
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+def test_all_reads_each_file_once(monkeypatch, capsys):
+    reads = []
+    read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    assert cli.main(["all", PROJECT_ROOT, "--no-report"]) == 0
+    weekly_view = Path(PROJECT_ROOT, WEEKLY_VIEW).resolve()
+    assert reads.count(weekly_view) == 1
+    assert len(reads) == len(set(reads))
+    assert "APPOINTMENT ALIGNMENT VERIFICATION" in capsys.readouterr().out
+
+
+def test_subcommand_imports_only_its_audit():
+    script = (
+        "import sys\n"
+        "from planner_audit import cli\n"
+        f"cli.main(['dom', {PROJECT_ROOT!r}])\n"
+        "print(' '.join(sorted(m for m in sys.modules if m.startswith('planner_audit'))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(result.stdout.strip().splitlines()[-1].split())
+    assert "planner_audit.dom" in loaded
+    assert not loaded & {
+        "planner_audit.system",
+        "planner_audit.positioning",
+        "planner_audit.alignment",
+    }
+
+
+@pytest.mark.parametrize("root", ["/nonexistent", str(Path(__file__).parent)])
+def test_invalid_project_root_is_usage_error(root, capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["dom", root])
+    assert exc.value.code == 2
+    assert "planner-audit: error:" in capsys.readouterr().err
+
+
+def test_cold_start_within_budget():
+    timings = coldstart.measure(PROJECT_ROOT, runs=3)
+    assert set(timings) == set(coldstart.COMMANDS)
+    over = {
+        command: round(ms)
+        for command, ms in timings.items()
+        if ms > coldstart.COLD_START_BUDGET_MS
+    }
+    assert not over, f"over {coldstart.COLD_START_BUDGET_MS}ms budget: {over}"